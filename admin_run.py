@@ -21,4 +21,5 @@ def admin_run(logging=False):
 
     print(f"Average profit: {sum_profit/DURATION}")
 
-admin_run()
\ No newline at end of file
+if __name__ == "__main__":
+    admin_run()
\ No newline at end of file
@@ -1,30 +1,25 @@
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
-from typing import Tuple, Literal
+from typing import NamedTuple, Tuple, Literal
 
-@dataclass
-class OrderType:
+class OrderType(NamedTuple):
     """
-    Data class to represent the order type, which can be either "limit" or "market"
+    Named tuple to represent the order type, which can be either "limit" or "market"
     """
     type: Literal["limit", "market"]
     from_time: int
     to_time: int
 
-    def __init__ (self, type: Literal["limit", "market"], from_time: int, to_time: int):
-        self.type = type
-        self.from_time = from_time
-        self.to_time = to_time
-
     def __str__(self):
         return f"OrderType(type={self.type}, from_time={self.from_time}, to_time={self.to_time})"
     
+    @staticmethod
     def new_limit_order(from_time: int, to_time: int):
         """
         Create a new limit order with the given from_time and to_time
         """
         return OrderType("limit", from_time, to_time)
     
+    @staticmethod
     def new_market_order(timestamp: int):
         """
         Create a new market order with the given timestamp
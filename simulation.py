@@ -20,6 +20,10 @@ START_MONEY = 10000
 FAST_INTERVAL = 60*10
 FAST_START_MONEY = 1000
 
+# Range of the random move applied to market orders, as a fraction of the price
+MARKET_MOVE_DOWN = 1 / 20
+MARKET_MOVE_UP = 1 / 30
+
 class Simulation():
     """
     A class to simulate the market maker game.
@@ -30,6 +34,7 @@ class Simulation():
         log_filename = f"log/{self.start_time.strftime('%Y%m%d_%H%M%S')}.log"
         self.logger = Logger(log_filename)
         self.market_maker = maker
+        self.rng = np.random.default_rng()
         self.buy = []
         self.mmBuy = [INIT_BUY]
         self.mmSell = [INIT_SELL]
@@ -109,6 +114,9 @@ class Simulation():
         :param logging: whether to log the execution of limit orders
         """
         profit = 0.0
+        # orders still waiting after this interval; rebuilt in one pass instead of
+        # removing from the list while iterating over it
+        pending = []
         for order in self.limit_order_queue:
             price = order[0]
             volume = order[1]
@@ -116,12 +124,12 @@ class Simulation():
             from_time = order[3]
             to_time = order[4]
             
-            # remove all orders that are expired
+            # drop all orders that are expired
             if timestamp > to_time:
-                self.limit_order_queue.remove(order)
                 continue
 
             if timestamp < from_time:
+                pending.append(order)
                 continue
 
             if buy_sell == "sell" and price >= market_buy and self.holding >= 0:
@@ -133,8 +141,8 @@ class Simulation():
                         self.logger.warning(f"Selling more than holding, setting volume to {volume}")
                 self.money += market_buy * volume
                 self.holding -= volume
-                self.limit_order_queue.remove(order)
                 profit += price * volume
+                continue
 
             if buy_sell == "buy" and price <= market_sell and market_sell > 0 and self.money >= 0:
                 if(logging):
@@ -146,8 +154,12 @@ class Simulation():
                         self.logger.warning(f"Buying more than available money, setting volume to {volume}")
                 self.money -= market_sell * volume
                 self.holding += volume
-                self.limit_order_queue.remove(order)
                 profit += -price * volume
+                continue
+
+            pending.append(order)
+
+        self.limit_order_queue = pending
         return profit
 
 
@@ -222,8 +234,8 @@ class Simulation():
             if(OrderType.type == "limit"):
                 [mmBuy, mmSell] = self.mm.getNextPrices(mb, vb, mS, vs)
             elif(OrderType.type == "market"):
-                mmBuy += np.random.uniform(-mmBuy / 20, mmBuy / 30)
-                mmSell += np.random.uniform(-mmSell / 20, mmSell / 30)
+                mmBuy += self.rng.uniform(-mmBuy * MARKET_MOVE_DOWN, mmBuy * MARKET_MOVE_UP)
+                mmSell += self.rng.uniform(-mmSell * MARKET_MOVE_DOWN, mmSell * MARKET_MOVE_UP)
                 [mmBuy, mmSell] = self.mm.getNextPrices(mmBuy, vb, mmSell, vs)
 
             self.mmBuy.append(mmBuy)
@@ -248,25 +260,28 @@ class Simulation():
 
             self.profit.append(profit)
             if(logging):
-                self.logger.log(f"Profit: {self.holding * (self.mmSell[-1]) + self.money - self.get_original_money()} Net change: {profit} Holding: {self.holding}")
+                self.logger.log(f"Profit: {self.get_final_profit()} Net change: {profit} Holding: {self.holding}")
                 self.logger.log(f"Cash: {self.money}")
                 self.logger.spacing()
             i += 1
     
     def summarize(self, logging = False):
         start_money = self.get_original_money()
-        print(f"Total profit: {self.holding * (self.mmSell[-1]) + self.money - start_money}")
-        print(f"Total holding: {self.holding} at price {self.mmSell[-1]} for a total of {self.holding * self.mmSell[-1]}")
+        last_price = self.mmSell[-1]
+        holding_value = self.holding * last_price
+        final = holding_value + self.money
+        total_profit = final - start_money
+        print(f"Total profit: {total_profit}")
+        print(f"Total holding: {self.holding} at price {last_price} for a total of {holding_value}")
         print(f"Total cash: {self.money}")
 
         if(logging):
             self.logger.log("Simulation End")
-            self.logger.log(f"Total profit: {self.holding * (self.mmSell[-1]) + self.money - start_money}")
+            self.logger.log(f"Total profit: {total_profit}")
             self.logger.log(f"Total cash: {self.money}")
-            self.logger.log(f"Total holding: {self.holding} at price {self.mmSell[-1]} for a total of {self.holding * self.mmSell[-1]}")
+            self.logger.log(f"Total holding: {self.holding} at price {last_price} for a total of {holding_value}")
             self.logger.spacing()
 
-        final = self.holding * (self.mmSell[-1]) + self.money
         print(f"Final Revenue: {final}")
         if(logging):
             self.logger.log(f"Final Revenue: {final}")